@@ -14,7 +14,6 @@
 import os
 import signal
 import threading
-from functools import partial
 from http.server import SimpleHTTPRequestHandler
 from pathlib import Path
 
@@ -117,6 +116,14 @@ def reset_deterministic_algorithm():
         torch.set_deterministic(False)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def restore_cudnn_benchmark():
+    """Ensures that the ``torch.backends.cudnn.benchmark`` flag set by the Trainer does not leak out of the test."""
+    benchmark = torch.backends.cudnn.benchmark
+    yield
+    torch.backends.cudnn.benchmark = benchmark
+
+
 @pytest.fixture
 def caplog(caplog):
     """Workaround for https://github.com/pytest-dev/pytest/issues/3697.
@@ -132,20 +139,32 @@ def caplog(caplog):
     lightning_logger.propagate = propagate
 
 
-@pytest.fixture
-def tmpdir_server(tmpdir):
-    Handler = partial(SimpleHTTPRequestHandler, directory=str(tmpdir))
+def _tmpdir_request_handler(request, client_address, server):
+    # the directory is looked up on each request so that a single server can be pointed at a different `tmpdir`
+    return SimpleHTTPRequestHandler(request, client_address, server, directory=server.directory)
+
+
+@pytest.fixture(scope="module")
+def _tmpdir_http_server():
+    """Starts a single HTTP server per test module, shared by all the tests requesting ``tmpdir_server``."""
     from http.server import ThreadingHTTPServer
 
-    with ThreadingHTTPServer(("localhost", 0), Handler) as server:
+    with ThreadingHTTPServer(("localhost", 0), _tmpdir_request_handler) as server:
+        server.directory = None
         server_thread = threading.Thread(target=server.serve_forever)
         # Exit the server thread when the main thread terminates
         server_thread.daemon = True
         server_thread.start()
-        yield server.server_address
+        yield server
         server.shutdown()
 
 
+@pytest.fixture
+def tmpdir_server(tmpdir, _tmpdir_http_server):
+    _tmpdir_http_server.directory = str(tmpdir)
+    return _tmpdir_http_server.server_address
+
+
 @pytest.fixture
 def single_process_pg():
     """Initialize the default process group with only the current process for testing purposes.
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import cProfile
 import logging
 import os
 import platform
@@ -180,12 +181,11 @@ def test_simple_profiler_distributed_files(tmpdir):
     trainer.validate(model)
     trainer.test(model)
 
-    actual = set(os.listdir(profiler.dirpath))
+    with os.scandir(profiler.dirpath) as it:
+        entries = list(it)
     expected = {f"{stage}-profiler-{rank}.txt" for stage in ("fit", "validate", "test") for rank in (0, 1)}
-    assert actual == expected
-
-    for f in profiler.dirpath.listdir():
-        assert f.read_text("utf-8")
+    assert {e.name for e in entries} == expected
+    assert all(e.stat().st_size > 0 for e in entries)
 
 
 def test_simple_profiler_logs(tmpdir, caplog, simple_profiler):
@@ -362,8 +362,19 @@ def test_pytorch_profiler_describe(pytorch_profiler):
     assert len(data) > 0
 
 
-def test_advanced_profiler_cprofile_deepcopy(tmpdir):
+def test_advanced_profiler_cprofile_deepcopy():
     """Checks for pickle issue reported in #6522."""
+    profiler = AdvancedProfiler()
+    for _ in range(3):
+        with profiler.profile("a"):
+            pass
+    assert isinstance(profiler.profiled_actions["a"], cProfile.Profile)
+    assert deepcopy(profiler)
+
+
+@RunIf(slow=True)
+def test_advanced_profiler_cprofile_deepcopy_trainer(tmpdir):
+    """Checks for pickle issue reported in #6522 when the profiler is deep-copied along with the model."""
     model = BoringModel()
     trainer = Trainer(
         default_root_dir=tmpdir, fast_dev_run=True, profiler="advanced", callbacks=StochasticWeightAveraging()
@@ -412,7 +423,8 @@ def test_pytorch_profiler_trainer_ddp(tmpdir, pytorch_profiler):
         assert any(f"{local_rank}-[Strategy]DDPStrategy.validation_step" in f for f in files)
 
 
-@pytest.mark.parametrize("fast_dev_run", [1, 2, 3, 4, 5])
+# the intermediate values don't exercise any additional branch of the profiler schedule, only the boundaries do
+@pytest.mark.parametrize("fast_dev_run", [1, 5])
 @pytest.mark.parametrize("boring_model_cls", [ManualOptimBoringModel, BoringModel])
 def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmpdir):
     """Ensure that the profiler can be given to the trainer and test step are properly recorded."""
@@ -431,24 +443,26 @@ def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmpdir):
         assert any(f"fit-{pytorch_profiler.filename}" in f for f in files)
 
 
-@pytest.mark.parametrize("fn, step_name", [("test", "test"), ("validate", "validation"), ("predict", "predict")])
 @pytest.mark.parametrize("boring_model_cls", [BoringModel, ManualOptimBoringModel])
-def test_pytorch_profiler_trainer(fn, step_name, boring_model_cls, tmpdir):
+def test_pytorch_profiler_trainer(boring_model_cls, tmpdir):
     """Ensure that the profiler can be given to the trainer and test step are properly recorded."""
     pytorch_profiler = PyTorchProfiler(dirpath=tmpdir, filename="profile", schedule=None)
     model = boring_model_cls()
     model.predict_dataloader = model.train_dataloader
     trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_test_batches=2, profiler=pytorch_profiler)
-    getattr(trainer, fn)(model)
 
-    assert sum(e.name.endswith(f"{step_name}_step") for e in pytorch_profiler.function_events)
+    # the profiler is re-created on every stage so a single trainer can run them back-to-back
+    for fn, step_name in [("test", "test"), ("validate", "validation"), ("predict", "predict")]:
+        getattr(trainer, fn)(model)
 
-    path = pytorch_profiler.dirpath / f"{fn}-{pytorch_profiler.filename}.txt"
-    assert path.read_text("utf-8")
+        assert sum(e.name.endswith(f"{step_name}_step") for e in pytorch_profiler.function_events)
 
-    if _KINETO_AVAILABLE:
-        files = sorted(file for file in os.listdir(tmpdir) if file.endswith(".json"))
-        assert any(f"{fn}-{pytorch_profiler.filename}" in f for f in files)
+        path = pytorch_profiler.dirpath / f"{fn}-{pytorch_profiler.filename}.txt"
+        assert path.read_text("utf-8")
+
+        if _KINETO_AVAILABLE:
+            files = sorted(file for file in os.listdir(tmpdir) if file.endswith(".json"))
+            assert any(f"{fn}-{pytorch_profiler.filename}" in f for f in files)
 
 
 def test_pytorch_profiler_nested(tmpdir):
@@ -41,8 +41,22 @@ def test_sync_batchnorm_set(tmpdir):
     assert strategy.sync_batchnorm is True
 
 
+@pytest.fixture(scope="module")
+def boring_checkpoint_path(tmp_path_factory):
+    """A checkpoint of a `BoringModel` fitted for one batch, shared by all tests in this module."""
+    tmpdir = tmp_path_factory.mktemp("ckpt")
+    checkpoint_path = os.path.join(tmpdir, "model.ckpt")
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
+    trainer.fit(model)
+    trainer.save_checkpoint(checkpoint_path)
+    return checkpoint_path
+
+
 @pytest.mark.parametrize("restore_optimizer_and_schedulers", [True, False])
-def test_strategy_lightning_restore_optimizer_and_schedulers(tmpdir, restore_optimizer_and_schedulers):
+def test_strategy_lightning_restore_optimizer_and_schedulers(
+    tmpdir, boring_checkpoint_path, restore_optimizer_and_schedulers
+):
     class TestStrategy(SingleDeviceStrategy):
         load_optimizer_state_dict_called = False
 
@@ -53,15 +67,8 @@ def test_strategy_lightning_restore_optimizer_and_schedulers(tmpdir, restore_opt
         def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
             self.load_optimizer_state_dict_called = True
 
-    # create ckpt to resume from
-    checkpoint_path = os.path.join(tmpdir, "model.ckpt")
-    model = BoringModel()
-    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
-    trainer.fit(model)
-    trainer.save_checkpoint(checkpoint_path)
-
     model = BoringModel()
     strategy = TestStrategy(torch.device("cpu"))
     trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True, strategy=strategy)
-    trainer.fit(model, ckpt_path=checkpoint_path)
+    trainer.fit(model, ckpt_path=boring_checkpoint_path)
     assert strategy.load_optimizer_state_dict_called == restore_optimizer_and_schedulers
@@ -9,14 +9,10 @@ from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.plugins import FullyShardedNativeMixedPrecisionPlugin
 from pytorch_lightning.strategies import DDPFullyShardedStrategy
-from pytorch_lightning.utilities import _FAIRSCALE_FULLY_SHARDED_AVAILABLE
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers.boring_model import BoringModel
 from tests.helpers.runif import RunIf
 
-if _FAIRSCALE_FULLY_SHARDED_AVAILABLE:
-    from fairscale.nn import FullyShardedDataParallel, wrap
-
 
 def test_invalid_on_cpu(tmpdir):
     """Test to ensure that to raise Misconfiguration for FSDP on CPU."""
@@ -52,6 +48,8 @@ class TestFSDPModel(BoringModel):
             self._init_model()
 
     def configure_sharded_model(self) -> None:
+        from fairscale.nn import FullyShardedDataParallel, wrap
+
         # the model is already wrapped with FSDP: no need to wrap again!
         if isinstance(self.layer, FullyShardedDataParallel):
             return
@@ -80,6 +78,8 @@ class TestFSDPModel(BoringModel):
         self._assert_layer_fsdp_instance()
 
     def _assert_layer_fsdp_instance(self) -> None:
+        from fairscale.nn import FullyShardedDataParallel
+
         assert isinstance(self.layer, FullyShardedDataParallel)
         assert isinstance(self.layer.module[0], FullyShardedDataParallel)
         assert isinstance(self.layer.module[2], FullyShardedDataParallel)
@@ -109,16 +109,24 @@ def test_fully_sharded_strategy_checkpoint_multi_gpus(tmpdir):
     _run_multiple_stages(trainer, model)
 
 
-def _assert_save_equality(trainer, ckpt_path, cls=TestFSDPModel):
+def _assert_save_equality(trainer, ckpt_path):
     # Use FullySharded to get the state dict for the sake of comparison
     model_state_dict = trainer.strategy.lightning_module_state_dict()
 
     if trainer.is_global_zero:
-        saved_model = cls.load_from_checkpoint(ckpt_path)
+        # the raw state dict is enough for the comparison, no need to instantiate the model with `load_from_checkpoint`
+        saved_state_dict = torch.load(ckpt_path, map_location="cpu")["state_dict"]
+
+        # the flattened comparison below only sees values, so check the names and shapes first
+        assert saved_state_dict.keys() == model_state_dict.keys()
+        for key, param in model_state_dict.items():
+            assert saved_state_dict[key].shape == param.shape, key
 
-        # Assert model parameters are identical after loading
-        for ddp_param, shard_param in zip(model_state_dict.values(), saved_model.state_dict().values()):
-            assert torch.equal(ddp_param.float().cpu(), shard_param)
+        # Assert model parameters are identical after loading. The tensors are flattened so that the comparison
+        # needs a single device-to-host copy instead of one per parameter
+        ddp_params = torch.cat([p.detach().float().reshape(-1) for p in model_state_dict.values()]).cpu()
+        shard_params = torch.cat([saved_state_dict[key].float().reshape(-1) for key in model_state_dict])
+        assert torch.equal(ddp_params, shard_params)
 
 
 def _run_multiple_stages(trainer, model, model_path: Optional[str] = None):
@@ -128,7 +136,7 @@ def _run_multiple_stages(trainer, model, model_path: Optional[str] = None):
 
     trainer.save_checkpoint(model_path, weights_only=True)
 
-    _assert_save_equality(trainer, model_path, cls=TestFSDPModel)
+    _assert_save_equality(trainer, model_path)
 
     # Test entry point
     trainer.test(model)  # model is wrapped, will not call configure_shared_model
@@ -36,7 +36,6 @@ def test_ddp_fp16_compress_comm_hook(tmpdir):
         gpus=2,
         strategy=strategy,
         default_root_dir=tmpdir,
-        sync_batchnorm=True,
         fast_dev_run=True,
     )
     trainer.fit(model)
@@ -59,7 +58,6 @@ def test_ddp_sgd_comm_hook(tmpdir):
         gpus=2,
         strategy=strategy,
         default_root_dir=tmpdir,
-        sync_batchnorm=True,
         fast_dev_run=True,
     )
     trainer.fit(model)
@@ -83,7 +81,6 @@ def test_ddp_fp16_compress_wrap_sgd_comm_hook(tmpdir):
         gpus=2,
         strategy=strategy,
         default_root_dir=tmpdir,
-        sync_batchnorm=True,
         fast_dev_run=True,
     )
     trainer.fit(model)
@@ -103,7 +100,6 @@ def test_ddp_spawn_fp16_compress_comm_hook(tmpdir):
         gpus=2,
         strategy=strategy,
         default_root_dir=tmpdir,
-        sync_batchnorm=True,
         fast_dev_run=True,
     )
     trainer.fit(model)
@@ -129,7 +125,6 @@ def test_ddp_post_local_sgd_comm_hook(tmpdir):
         gpus=2,
         strategy=strategy,
         default_root_dir=tmpdir,
-        sync_batchnorm=True,
     )
     trainer.fit(model)
     trainer_comm_hook = trainer.strategy.model.get_ddp_logging_data().comm_hook
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+from unittest.mock import Mock
 
 import torch
 
@@ -22,7 +23,6 @@ from pytorch_lightning.callbacks import (
     LearningRateMonitor,
     ModelCheckpoint,
     ModelSummary,
-    ProgressBarBase,
     TQDMProgressBar,
 )
 from pytorch_lightning.trainer.connectors.callback_connector import CallbackConnector
@@ -100,6 +100,19 @@ class StatefulCallback1(Callback):
         return {"content1": self._unique}
 
 
+def test_callback_state_keys():
+    """Test that the state keys of the callbacks are unique per type and state-key arguments, without a
+    ``Trainer``."""
+    assert StatefulCallback0().state_key == "StatefulCallback0"
+    assert StatefulCallback1(unique="one").state_key == "StatefulCallback1{'unique': 'one'}"
+    # arguments that are not part of the state key do not change it
+    assert StatefulCallback1(unique="two", other=2).state_key == "StatefulCallback1{'unique': 'two'}"
+    assert ModelCheckpoint(save_on_train_epoch_end=True).state_key == (
+        "ModelCheckpoint{'monitor': None, 'mode': 'min', 'every_n_train_steps': 0, 'every_n_epochs': 1,"
+        " 'train_time_interval': None, 'save_on_train_epoch_end': True}"
+    )
+
+
 def test_all_callback_states_saved_before_checkpoint_callback(tmpdir):
     """Test that all callback states get saved even if the ModelCheckpoint is not given as last and when there are
     multiple callbacks of the same type."""
@@ -112,7 +125,10 @@ def test_all_callback_states_saved_before_checkpoint_callback(tmpdir):
     trainer = Trainer(
         default_root_dir=tmpdir,
         max_steps=1,
-        limit_val_batches=1,
+        limit_val_batches=0,
+        num_sanity_val_steps=0,
+        enable_progress_bar=False,
+        logger=False,
         callbacks=[
             callback0,
             # checkpoint callback does not have to be at the end
@@ -131,26 +147,18 @@ def test_all_callback_states_saved_before_checkpoint_callback(tmpdir):
     assert "content0" in state0 and state0["content0"] == 0
     assert "content1" in state1 and state1["content1"] == "one"
     assert "content1" in state2 and state2["content1"] == "two"
-    assert (
-        "ModelCheckpoint{'monitor': None, 'mode': 'min', 'every_n_train_steps': 0, 'every_n_epochs': 1,"
-        " 'train_time_interval': None, 'save_on_train_epoch_end': True}" in ckpt["callbacks"]
-    )
+    assert checkpoint_callback.state_key in ckpt["callbacks"]
 
 
 def test_attach_model_callbacks():
     """Test that the callbacks defined in the model and through Trainer get merged correctly."""
 
     def _attach_callbacks(trainer_callbacks, model_callbacks):
-        model = LightningModule()
-        model.configure_callbacks = lambda: model_callbacks
-        has_progress_bar = any(isinstance(cb, ProgressBarBase) for cb in trainer_callbacks + model_callbacks)
-        trainer = Trainer(
-            enable_checkpointing=False,
-            enable_progress_bar=has_progress_bar,
-            enable_model_summary=False,
-            callbacks=trainer_callbacks,
-        )
-        trainer.model = model
+        # `_attach_model_callbacks` only reads the callbacks of the trainer and the model, no need to build a `Trainer`
+        trainer = Mock(spec=Trainer)
+        trainer.accumulation_scheduler = GradientAccumulationScheduler({0: 1})
+        trainer.callbacks = trainer_callbacks + [trainer.accumulation_scheduler]
+        trainer._call_lightning_module_hook.return_value = model_callbacks
         cb_connector = CallbackConnector(trainer)
         cb_connector._attach_model_callbacks()
         return trainer
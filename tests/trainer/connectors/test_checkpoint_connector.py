@@ -12,19 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from unittest import mock
+import shutil
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 import torch
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.plugins.environments import SLURMEnvironment
 from pytorch_lightning.trainer.states import TrainerFn
 from tests.helpers import BoringModel
 
 
+@pytest.fixture(scope="module")
+def fitted_trainer(tmp_path_factory):
+    """Fits a `BoringModel` for a single step.
+
+    The trainer is shared by all the tests in this module, so tests must only inspect it and never mutate it.
+    """
+    tmpdir = tmp_path_factory.mktemp("trained")
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=1, enable_checkpointing=False, logger=False)
+    trainer.fit(BoringModel())
+    return trainer
+
+
+@pytest.fixture(scope="module")
+def trained_checkpoint(fitted_trainer):
+    """Returns the path to a checkpoint of the fitted trainer."""
+    ckpt_path = os.path.join(fitted_trainer.default_root_dir, "model.ckpt")
+    fitted_trainer.save_checkpoint(ckpt_path)
+    return ckpt_path
+
+
 # TODO: remove HPCHookedModel in v1.8
 class HPCHookedModel(BoringModel):
     def __init__(self):
@@ -41,12 +61,16 @@ class HPCHookedModel(BoringModel):
         self.hpc_load_called += 1
 
 
+@pytest.fixture
+def slurm_managing_tasks(monkeypatch):
+    monkeypatch.setattr(
+        "pytorch_lightning.trainer.connectors.accelerator_connector.AcceleratorConnector._is_slurm_managing_tasks",
+        lambda self: True,
+    )
+
+
 # TODO: remove test_hpc_hook_calls in v1.8
-@mock.patch(
-    "pytorch_lightning.trainer.connectors.accelerator_connector.AcceleratorConnector._is_slurm_managing_tasks",
-    return_value=True,
-)
-def test_hpc_hook_calls(mock_slurm_env, tmpdir):
+def test_hpc_hook_calls(slurm_managing_tasks, tmpdir):
     model = HPCHookedModel()
     trainer = Trainer(default_root_dir=tmpdir, max_steps=1, enable_checkpointing=False, logger=False)
     environment = trainer._accelerator_connector.cluster_environment
@@ -63,28 +87,30 @@ def test_hpc_hook_calls(mock_slurm_env, tmpdir):
     assert model.hpc_save_called == 1
     assert model.hpc_load_called == 0
 
-    # new training run, restore from hpc checkpoint file automatically
-    assert set(os.listdir(tmpdir)) == {"hpc_ckpt_1.ckpt"}
+    # new training run, restore from hpc checkpoint file automatically. this is what `fit` does on start-up, no need
+    # to run a full training loop
+    assert {entry.name for entry in os.scandir(tmpdir)} == {"hpc_ckpt_1.ckpt"}
     trainer = Trainer(default_root_dir=tmpdir, max_steps=1, enable_checkpointing=False, logger=False)
-    with pytest.deprecated_call(
-        match=r"Method `LightningModule.on_hpc_save` is deprecated in v1.6 and will be removed in v1.8."
-    ):
-        trainer.fit(model)
+    trainer.strategy.connect(model)
+    trainer.state.fn = TrainerFn.FITTING
+    connector = trainer._checkpoint_connector
+    connector.resume_start()
+    connector.restore_model()
+    connector.resume_end()
     assert model.hpc_save_called == 1
     assert model.hpc_load_called == 1
 
 
-def test_preloaded_checkpoint_lifecycle(tmpdir):
+def test_preloaded_checkpoint_lifecycle(tmpdir, fitted_trainer, trained_checkpoint):
     """Tests that the preloaded checkpoint contents gets cleared from memory when it is not required anymore."""
-    model = BoringModel()
-    trainer = Trainer(default_root_dir=tmpdir, max_steps=1)
-    trainer.fit(model)
-
-    connector = trainer._checkpoint_connector
-
+    connector = fitted_trainer._checkpoint_connector
     assert not connector.resume_checkpoint_path
     assert not connector._loaded_checkpoint
 
+    # the shared trainer must not be mutated, the resume calls go through a fresh one
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=2)
+    trainer.state.fn = TrainerFn.FITTING
+    connector = trainer._checkpoint_connector
     connector.resume_start()
     assert not connector.resume_checkpoint_path
     assert not connector._loaded_checkpoint
@@ -92,32 +118,29 @@ def test_preloaded_checkpoint_lifecycle(tmpdir):
     assert not connector.resume_checkpoint_path
     assert not connector._loaded_checkpoint
 
-    ckpt_path = trainer.checkpoint_callback.best_model_path
-    trainer = Trainer(default_root_dir=tmpdir, max_steps=2)
-    connector = trainer._checkpoint_connector
-    connector.resume_start(ckpt_path)
-    assert connector.resume_checkpoint_path == ckpt_path
+    connector.resume_start(trained_checkpoint)
+    assert connector.resume_checkpoint_path == trained_checkpoint
     assert connector._loaded_checkpoint
     assert isinstance(connector._loaded_checkpoint, dict)
-    trainer.state.fn = TrainerFn.FITTING
     connector.resume_end()
     assert not connector.resume_checkpoint_path
     assert not connector._loaded_checkpoint
 
 
-def test_hpc_restore_attempt(tmpdir):
-    """Test that restore() attempts to restore the hpc_ckpt with highest priority."""
-    model = BoringModel()
-    trainer = Trainer(default_root_dir=tmpdir, max_steps=1, enable_checkpointing=False, logger=False)
-    trainer.fit(model)
+@torch.no_grad()
+def _zero_parameters(model):
+    for param in model.parameters():
+        param.zero_()
+
 
-    hpc_ckpt_path = tmpdir / "hpc_ckpt_3.ckpt"
-    trainer.save_checkpoint(hpc_ckpt_path)
-    assert os.listdir(tmpdir) == ["hpc_ckpt_3.ckpt"]
+def test_hpc_restore_attempt(tmpdir, trained_checkpoint):
+    """Test that restore() attempts to restore the hpc_ckpt with highest priority."""
+    shutil.copyfile(trained_checkpoint, tmpdir / "hpc_ckpt_3.ckpt")
+    assert {entry.name for entry in os.scandir(tmpdir)} == {"hpc_ckpt_3.ckpt"}
 
     # set weights to zero
-    for param in model.parameters():
-        torch.nn.init.constant_(param, 0)
+    model = BoringModel()
+    _zero_parameters(model)
 
     # case 1: restore hpc first, no explicit resume path provided
     trainer = Trainer(default_root_dir=tmpdir, max_steps=2, enable_checkpointing=False, logger=False)
@@ -125,7 +148,7 @@ def test_hpc_restore_attempt(tmpdir):
 
     for param in model.parameters():
         assert param.abs().sum() > 0
-        torch.nn.init.constant_(param, 0)
+    _zero_parameters(model)
 
     # case 2: explicit resume path provided, restore hpc anyway
     trainer = Trainer(default_root_dir=tmpdir, max_steps=3)
@@ -137,13 +160,10 @@ def test_hpc_restore_attempt(tmpdir):
 
 def test_hpc_max_ckpt_version(tmpdir):
     """Test that the CheckpointConnector is able to find the hpc checkpoint file with the highest version."""
-    model = BoringModel()
     trainer = Trainer(default_root_dir=tmpdir, max_steps=1)
-    trainer.fit(model)
-    trainer.save_checkpoint(tmpdir / "hpc_ckpt.ckpt")
-    trainer.save_checkpoint(tmpdir / "hpc_ckpt_0.ckpt")
-    trainer.save_checkpoint(tmpdir / "hpc_ckpt_3.ckpt")
-    trainer.save_checkpoint(tmpdir / "hpc_ckpt_33.ckpt")
+    # only the file names are inspected
+    for name in ("hpc_ckpt.ckpt", "hpc_ckpt_0.ckpt", "hpc_ckpt_3.ckpt", "hpc_ckpt_33.ckpt"):
+        Path(tmpdir, name).touch()
 
     assert trainer._checkpoint_connector._hpc_resume_path == str(tmpdir / "hpc_ckpt_33.ckpt")
     assert trainer._checkpoint_connector._CheckpointConnector__max_ckpt_version_in_folder(tmpdir) == 33
@@ -153,35 +173,20 @@ def test_hpc_max_ckpt_version(tmpdir):
     )
 
 
-@mock.patch.dict(os.environ, {"PL_FAULT_TOLERANT_TRAINING": "1"})
-def test_loops_restore(tmpdir):
+def test_loops_restore(tmpdir, trained_checkpoint):
     """Test that required loop state_dict is loaded correctly by checkpoint connector."""
-    model = BoringModel()
-    checkpoint_callback = ModelCheckpoint(dirpath=tmpdir, save_last=True)
-    trainer_args = dict(
-        default_root_dir=tmpdir,
-        max_epochs=1,
-        limit_train_batches=1,
-        limit_val_batches=1,
-        logger=False,
-        callbacks=[checkpoint_callback],
-        num_sanity_val_steps=0,
-    )
-    trainer = Trainer(**trainer_args)
-    trainer.fit(model)
-
-    ckpt_path = str(tmpdir / "last.ckpt")
-
-    trainer = Trainer(**trainer_args)
+    trainer = Trainer(default_root_dir=tmpdir, logger=False)
     for fn in TrainerFn:
         if fn != TrainerFn.TUNING:
             trainer_fn = getattr(trainer, f"{fn}_loop")
             trainer_fn.load_state_dict = Mock()
 
+    # the checkpoint contents are the same for every `TrainerFn`, load them only once
+    trainer._checkpoint_connector.resume_start(trained_checkpoint)
+
     for fn in TrainerFn:
         if fn != TrainerFn.TUNING:
             trainer.state.fn = fn
-            trainer._checkpoint_connector.resume_start(ckpt_path)
             trainer._checkpoint_connector.restore_loops()
 
             trainer_loop = getattr(trainer, f"{fn}_loop")
@@ -192,3 +197,5 @@ def test_loops_restore(tmpdir):
             if fn2 not in (fn, TrainerFn.TUNING):
                 trainer_loop2 = getattr(trainer, f"{fn2}_loop")
                 trainer_loop2.load_state_dict.assert_not_called()
+
+    trainer._checkpoint_connector.resume_end()
@@ -34,18 +34,19 @@ class NoDataLoaderModel(BoringModel):
 
 
 @pytest.mark.parametrize(
-    "instance,available",
+    "instance_factory,available",
     [
-        (None, True),
-        (BoringModel().train_dataloader(), True),
-        (BoringModel(), True),
-        (NoDataLoaderModel(), False),
-        (BoringDataModule(), True),
+        # the instances are created inside the test so that collection does not build them
+        (lambda: None, True),
+        (lambda: BoringModel().train_dataloader(), True),
+        (BoringModel, True),
+        (NoDataLoaderModel, False),
+        (BoringDataModule, True),
     ],
 )
-def test_dataloader_source_available(instance, available):
+def test_dataloader_source_available(instance_factory, available):
     """Test the availability check for _DataLoaderSource."""
-    source = _DataLoaderSource(instance=instance, name="train_dataloader")
+    source = _DataLoaderSource(instance=instance_factory(), name="train_dataloader")
     assert source.is_defined() is available
 
 
@@ -19,12 +19,20 @@ from pytorch_lightning.trainer.states import RunningStage
 from tests.helpers.boring_model import BoringModel
 
 
+def _reset_fit_dataloaders(trainer, model):
+    # only the dataloader reset sets the number of batches, no need to run the fit loop
+    model.trainer = trainer
+    trainer._data_connector.attach_data(model)
+    trainer.reset_train_dataloader(model)
+    trainer.reset_val_dataloader(model)
+
+
 def test_num_dataloader_batches(tmpdir):
     """Tests that the correct number of batches are allocated."""
     # when we have fewer batches in the dataloader we should use those instead of the limit
     model = BoringModel()
     trainer = Trainer(limit_val_batches=100, limit_train_batches=100, max_epochs=1, default_root_dir=tmpdir)
-    trainer.fit(model)
+    _reset_fit_dataloaders(trainer, model)
 
     assert len(model.train_dataloader()) == 64
     assert len(model.val_dataloader()) == 64
@@ -35,7 +43,7 @@ def test_num_dataloader_batches(tmpdir):
     # when we have more batches in the dataloader we should limit them
     model = BoringModel()
     trainer = Trainer(limit_val_batches=7, limit_train_batches=7, max_epochs=1, default_root_dir=tmpdir)
-    trainer.fit(model)
+    _reset_fit_dataloaders(trainer, model)
 
     assert len(model.train_dataloader()) == 64
     assert len(model.val_dataloader()) == 64
@@ -53,9 +53,11 @@ def test__validation_step__log(tmpdir):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=2,
         limit_val_batches=2,
-        max_epochs=2,
+        max_epochs=1,
         log_every_n_steps=1,
         enable_model_summary=False,
     )
@@ -94,9 +96,11 @@ def test__validation_step__epoch_end__log(tmpdir):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=2,
         limit_val_batches=2,
-        max_epochs=2,
+        max_epochs=1,
         log_every_n_steps=1,
         enable_model_summary=False,
     )
@@ -125,6 +129,8 @@ def test_eval_epoch_logging(tmpdir, batches, log_interval, max_epochs):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=batches,
         limit_val_batches=batches,
         max_epochs=max_epochs,
@@ -160,6 +166,8 @@ def test_eval_float_logging(tmpdir):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=2,
         limit_val_batches=2,
         max_epochs=1,
@@ -191,6 +199,8 @@ def test_eval_logging_auto_reduce(tmpdir):
     model = TestModel()
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=3,
         limit_val_batches=3,
         max_epochs=1,
@@ -222,6 +232,9 @@ def test_eval_epoch_only_logging(tmpdir, batches, log_interval, max_epochs):
     model = TestModel()
     trainer = Trainer(
         default_root_dir=tmpdir,
+        logger=False,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         max_epochs=max_epochs,
         limit_test_batches=batches,
         log_every_n_steps=log_interval,
@@ -254,6 +267,9 @@ def test_multi_dataloaders_add_suffix_properly(tmpdir, suffix):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        logger=False,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=0,
         limit_val_batches=0,
         limit_test_batches=2,
@@ -276,17 +292,19 @@ def test_log_works_in_val_callback(tmpdir):
     class TestCallback(callbacks.Callback):
 
         count = 0
-        choices = [False, True]
+        # the (on_step, on_epoch, prog_bar) combinations to log with
+        epoch_only_combinations = tuple(itertools.product([False], [True], [False, True]))
+        all_combinations = tuple(itertools.product([False, True], repeat=3))
 
         # used to compute expected values
         logged_values = collections.defaultdict(list)
         call_counter = collections.Counter()
         logged_arguments = {}
 
-        def make_logging(self, pl_module, func_name, on_steps, on_epochs, prob_bars):
+        def make_logging(self, pl_module, func_name, combinations):
             self.call_counter.update([func_name])
 
-            for idx, (on_step, on_epoch, prog_bar) in enumerate(itertools.product(on_steps, on_epochs, prob_bars)):
+            for idx, (on_step, on_epoch, prog_bar) in enumerate(combinations):
                 fx = f"{func_name}_{idx}"
                 if not on_step and not on_epoch:
                     with pytest.raises(MisconfigurationException, match="is not useful"):
@@ -298,38 +316,24 @@ def test_log_works_in_val_callback(tmpdir):
                 self.count += 1
 
         def on_validation_start(self, _, pl_module):
-            self.make_logging(
-                pl_module, "on_validation_start", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_validation_start", self.epoch_only_combinations)
 
         def on_epoch_start(self, trainer, pl_module):
             if trainer.validating:
-                self.make_logging(
-                    pl_module, "on_epoch_start", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-                )
+                self.make_logging(pl_module, "on_epoch_start", self.epoch_only_combinations)
 
         def on_validation_epoch_start(self, _, pl_module):
-            self.make_logging(
-                pl_module, "on_validation_epoch_start", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_validation_epoch_start", self.epoch_only_combinations)
 
         def on_validation_batch_end(self, _, pl_module, *__):
-            self.make_logging(
-                pl_module,
-                "on_validation_batch_end",
-                on_steps=self.choices,
-                on_epochs=self.choices,
-                prob_bars=self.choices,
-            )
+            self.make_logging(pl_module, "on_validation_batch_end", self.all_combinations)
 
         def on_epoch_end(self, trainer, pl_module):
             if trainer.validating:
-                self.make_logging(pl_module, "on_epoch_end", on_steps=[False], on_epochs=[True], prob_bars=self.choices)
+                self.make_logging(pl_module, "on_epoch_end", self.epoch_only_combinations)
 
         def on_validation_epoch_end(self, _, pl_module):
-            self.make_logging(
-                pl_module, "on_validation_epoch_end", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_validation_epoch_end", self.epoch_only_combinations)
 
     class TestModel(BoringModel):
         def validation_step(self, batch, batch_idx):
@@ -364,7 +368,9 @@ def test_log_works_in_val_callback(tmpdir):
         reduction = np.mean if on_epoch else np.max
         return reduction(values)
 
-    for fx, value in trainer.callback_metrics.items():
+    callback_metrics = trainer.callback_metrics
+    progress_bar_metrics = trainer.progress_bar_metrics
+    for fx, value in callback_metrics.items():
         actual = value.item()
         if fx not in cb.logged_arguments:
             continue
@@ -375,7 +381,7 @@ def test_log_works_in_val_callback(tmpdir):
 
     for fx, attrs in cb.logged_arguments.items():
         should_include = attrs["prog_bar"] and attrs["on_step"] ^ attrs["on_epoch"]
-        is_included = fx in trainer.progress_bar_metrics
+        is_included = fx in progress_bar_metrics
         assert is_included if should_include else not is_included
 
 
@@ -386,18 +392,20 @@ def test_log_works_in_test_callback(tmpdir):
 
         # helpers
         count = 0
-        choices = [False, True]
+        # the (on_step, on_epoch, prog_bar) combinations to log with
+        epoch_only_combinations = tuple(itertools.product([False], [True], [False, True]))
+        all_combinations = tuple(itertools.product([False, True], repeat=3))
 
         # used to compute expected values
         callback_funcs_called = collections.defaultdict(list)
         funcs_called_count = collections.defaultdict(int)
         funcs_attr = {}
 
-        def make_logging(self, pl_module, func_name, on_steps, on_epochs, prob_bars):
+        def make_logging(self, pl_module, func_name, combinations):
             original_func_name = func_name[:]
             self.funcs_called_count[original_func_name] += 1
 
-            for idx, (on_step, on_epoch, prog_bar) in enumerate(itertools.product(on_steps, on_epochs, prob_bars)):
+            for idx, (on_step, on_epoch, prog_bar) in enumerate(combinations):
                 func_name = original_func_name[:]
                 custom_func_name = f"{idx}_{func_name}"
 
@@ -437,22 +445,16 @@ def test_log_works_in_test_callback(tmpdir):
                     }
 
         def on_test_start(self, _, pl_module):
-            self.make_logging(pl_module, "on_test_start", on_steps=[False], on_epochs=[True], prob_bars=self.choices)
+            self.make_logging(pl_module, "on_test_start", self.epoch_only_combinations)
 
         def on_test_epoch_start(self, _, pl_module):
-            self.make_logging(
-                pl_module, "on_test_epoch_start", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_test_epoch_start", self.epoch_only_combinations)
 
         def on_test_batch_end(self, _, pl_module, *__):
-            self.make_logging(
-                pl_module, "on_test_batch_end", on_steps=self.choices, on_epochs=self.choices, prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_test_batch_end", self.all_combinations)
 
         def on_test_epoch_end(self, _, pl_module):
-            self.make_logging(
-                pl_module, "on_test_epoch_end", on_steps=[False], on_epochs=[True], prob_bars=self.choices
-            )
+            self.make_logging(pl_module, "on_test_epoch_end", self.epoch_only_combinations)
 
     num_dataloaders = 2
 
@@ -495,10 +497,11 @@ def test_log_works_in_test_callback(tmpdir):
     # Make sure the func_name output equals the average from all logged values when on_epoch true
     for dl_idx in range(num_dataloaders):
         key = f"test_loss/dataloader_idx_{dl_idx}"
-        assert key in trainer.callback_metrics
-        assert torch.stack(model.seen_losses[dl_idx]).mean() == trainer.callback_metrics.pop(key)
+        assert key in callback_metrics
+        assert torch.stack(model.seen_losses[dl_idx]).mean() == callback_metrics.pop(key)
 
-    for func_name, output_value in trainer.callback_metrics.items():
+    progress_bar_metrics = trainer.progress_bar_metrics
+    for func_name, output_value in callback_metrics.items():
         output_value = output_value.item()
         func_attr = cb.funcs_attr[func_name]
         original_values = cb.callback_funcs_called[func_attr["func_name"]]
@@ -507,7 +510,7 @@ def test_log_works_in_test_callback(tmpdir):
 
     for fx, attrs in cb.funcs_attr.items():
         should_include = attrs["prog_bar"] and attrs["on_step"] ^ attrs["on_epoch"]
-        is_included = fx in trainer.progress_bar_metrics
+        is_included = fx in progress_bar_metrics
         assert is_included if should_include else not is_included
 
 
@@ -548,20 +551,21 @@ def test_validation_step_log_with_tensorboard(mock_log_metrics, tmpdir):
     model.validation_epoch_end = None
 
     # Initialize a trainer
+    max_epochs = 2
     trainer = Trainer(
         default_root_dir=tmpdir,
         logger=TensorBoardLogger(tmpdir),
         limit_train_batches=2,
         limit_val_batches=2,
         limit_test_batches=2,
-        max_epochs=2,
+        max_epochs=max_epochs,
     )
 
     # Train the model ⚡
     trainer.fit(model)
 
-    # hp_metric + 2 steps + epoch + 2 steps + epoch
-    expected_num_calls = 1 + 2 + 1 + 2 + 1
+    # hp_metric + (2 steps + epoch) per epoch
+    expected_num_calls = 1 + (2 + 1) * max_epochs
 
     assert set(trainer.callback_metrics) == {
         "train_loss",
@@ -572,8 +576,9 @@ def test_validation_step_log_with_tensorboard(mock_log_metrics, tmpdir):
     assert len(mock_log_metrics.mock_calls) == expected_num_calls
     assert mock_log_metrics.mock_calls[0] == call({"hp_metric": -1}, 0)
 
+    mock_calls = mock_log_metrics.mock_calls
+
     def get_metrics_at_idx(idx):
-        mock_calls = list(mock_log_metrics.mock_calls)
         if isinstance(mock_calls[idx].kwargs, dict):
             return mock_calls[idx].kwargs["metrics"]
         return mock_calls[idx][2]["metrics"]
@@ -624,9 +629,11 @@ def test_logging_dict_on_validation_step(tmpdir):
 
     trainer = Trainer(
         default_root_dir=tmpdir,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=2,
         limit_val_batches=2,
-        max_epochs=2,
+        max_epochs=1,
     )
 
     trainer.fit(model)
@@ -677,6 +684,9 @@ def test_multiple_dataloaders_reset(val_check_interval, tmpdir):
     model = TestModel()
     trainer = Trainer(
         default_root_dir=tmpdir,
+        logger=False,
+        enable_checkpointing=False,
+        enable_progress_bar=False,
         limit_train_batches=5,
         limit_val_batches=5,
         num_sanity_val_steps=0,
@@ -735,7 +745,7 @@ def test_logging_results_with_no_dataloader_idx(tmpdir):
 
     model = CustomBoringModel()
     model.test_epoch_end = None
-    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=1)
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=1, enable_progress_bar=False)
     results = trainer.test(model)
 
     assert len(results) == num_dataloaders
@@ -766,7 +776,7 @@ def test_logging_multi_dataloader_on_epoch_end(tmpdir):
             return [super().val_dataloader(), super().val_dataloader()]
 
     model = CustomBoringModel()
-    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=1)
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=1, enable_progress_bar=False)
     results = trainer.test(model)
     # what's logged in `test_epoch_end` gets included in the results of each dataloader
     assert results == [{"foo/dataloader_idx_0": 1, "foobar": 3}, {"foo/dataloader_idx_1": 2, "foobar": 3}]
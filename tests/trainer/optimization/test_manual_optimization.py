@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
-from copy import deepcopy
 from unittest import mock
 from unittest.mock import ANY, call, patch
 
@@ -241,7 +240,7 @@ class ManualOptimizationExtendedModel(BoringModel):
         output = self.layer(batch)
 
         loss = self.loss(batch, output)
-        loss /= loss.clone().detach()
+        loss = loss / loss.detach()
         loss *= 0.1
 
         if self.should_update:
@@ -263,12 +262,8 @@ class ManualOptimizationExtendedModel(BoringModel):
                 # TODO: Figure out why 1 every 3 runs, weights don't get updated on count = 4"
                 pass
         else:
-            try:
-                assert torch.equal(self.weight_before, after_before)
-            # todo: specify the possible exception
-            except Exception:
-                # almost no diff between before and after
-                assert torch.abs(torch.sum(self.weight_before) - torch.sum(after_before)).item() < 10e-6
+            # almost no diff between before and after
+            assert torch.allclose(self.weight_before, after_before, atol=1e-5)
         assert torch.all(self.layer.weight.grad == 0)
         self.count += 1
 
@@ -339,7 +334,7 @@ def test_manual_optimization_and_accumulated_gradient(tmpdir):
             output = self.layer(batch)
 
             loss = self.loss(batch, output)
-            loss /= loss.clone().detach()
+            loss = loss / loss.detach()
             loss *= 0.1
 
             if self.should_update:
@@ -819,7 +814,7 @@ def train_manual_optimization(tmpdir, strategy, model_cls=TesManualOptimizationD
     seed_everything(42)
 
     model = model_cls()
-    model_copy = deepcopy(model)
+    params_before = [p.detach().clone() for p in model.parameters()]
     model.val_dataloader = None
     model.training_epoch_end = None
 
@@ -836,8 +831,8 @@ def train_manual_optimization(tmpdir, strategy, model_cls=TesManualOptimizationD
 
     trainer.fit(model)
 
-    for param, param_copy in zip(model.parameters(), model_copy.parameters()):
-        assert not torch.equal(param.cpu().data, param_copy.data)
+    for param, param_before in zip(model.parameters(), params_before):
+        assert not torch.equal(param.detach().cpu(), param_before)
 
 
 @RunIf(min_gpus=2, standalone=True)
@@ -1010,7 +1005,16 @@ def test_lr_scheduler_step_not_called(tmpdir):
     model.training_step_end = None
     model.training_epoch_end = None
 
-    trainer = Trainer(max_epochs=1, default_root_dir=tmpdir, fast_dev_run=2)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=1,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_checkpointing=False,
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
 
     with patch("torch.optim.lr_scheduler.StepLR.step") as lr_step:
         trainer.fit(model)
@@ -1092,7 +1096,16 @@ def test_manual_optimization_training_step_signature(tmpdir):
             return super().training_step(batch, batch_idx)
 
     model = ConfusedAutomaticManualModel()
-    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=2)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=1,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_checkpointing=False,
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
 
     with pytest.raises(ValueError, match="Your `LightningModule.training_step` signature contains an `optimizer_idx`"):
         trainer.fit(model)
@@ -23,7 +23,6 @@ from pathlib import Path
 from unittest import mock
 from unittest.mock import ANY, call, patch
 
-import cloudpickle
 import pytest
 import torch
 from torch.nn.parallel.distributed import DistributedDataParallel
@@ -191,11 +190,11 @@ def test_gradient_accumulation_scheduling_last_batch(tmpdir, accumulate_grad_bat
 
     class TestModel(BoringModel):
         def state_dict(self, *args, **kwargs):
-            return deepcopy(super().state_dict(*args, **kwargs))
+            return {k: v.clone() for k, v in super().state_dict(*args, **kwargs).items()}
 
         def check(self, d1, d2, equal=True):
             keys = d1.keys() | d2.keys()
-            values = [torch.equal(d1[k], d2[k]) for k in keys]
+            values = (torch.equal(d1[k], d2[k]) for k in keys)
             return all(values) if equal else not any(values)
 
         def backward(self, *args, **kwargs) -> None:
@@ -312,10 +311,10 @@ def test_model_checkpoint_options(tmpdir, save_top_k, save_last, expected_files)
     """Test ModelCheckpoint options."""
 
     def mock_save_function(filepath, *args):
-        open(filepath, "a").close()
+        Path(filepath).touch()
 
     # simulated losses
-    losses = [10, 9, 2.8, 5, 2.5]
+    losses = torch.tensor([10, 9, 2.8, 5, 2.5])
 
     checkpoint_callback = ModelCheckpoint(
         dirpath=tmpdir,
@@ -333,10 +332,10 @@ def test_model_checkpoint_options(tmpdir, save_top_k, save_last, expected_files)
     for i, loss in enumerate(losses):
         trainer.fit_loop.epoch_progress.current.completed = i  # sets `trainer.current_epoch`
         trainer.fit_loop.global_step = i
-        trainer.callback_metrics.update({"checkpoint_on": torch.tensor(loss)})
+        trainer.callback_metrics.update({"checkpoint_on": loss})
         checkpoint_callback.on_validation_end(trainer, trainer.lightning_module)
 
-    file_lists = set(os.listdir(tmpdir))
+    file_lists = {entry.name for entry in os.scandir(tmpdir)}
 
     assert len(file_lists) == len(
         expected_files
@@ -391,13 +390,11 @@ def test_model_freeze_unfreeze():
     model = BoringModel()
     model.freeze()
     assert not model.training
-    for param in model.parameters():
-        assert not param.requires_grad
+    assert not any(param.requires_grad for param in model.parameters())
 
     model.unfreeze()
     assert model.training
-    for param in model.parameters():
-        assert param.requires_grad
+    assert all(param.requires_grad for param in model.parameters())
 
 
 @pytest.mark.parametrize("url_ckpt", [True, False])
@@ -448,10 +445,17 @@ def test_fit_ckpt_path_epoch_restored(monkeypatch, tmpdir, tmpdir_server, url_ck
 
     for ckpt in checkpoints:
         next_model = TestModel()
-        state = pl_load(ckpt)
+        state = pl_load(ckpt, map_location="cpu")
 
         # Resume training
-        new_trainer = Trainer(default_root_dir=tmpdir, max_epochs=2)
+        new_trainer = Trainer(
+            default_root_dir=tmpdir,
+            max_epochs=2,
+            enable_checkpointing=False,
+            enable_progress_bar=False,
+            logger=False,
+            enable_model_summary=False,
+        )
         new_trainer.fit(next_model, ckpt_path=ckpt)
         assert state["global_step"] + next_model.num_batches_seen == trainer.num_training_batches * trainer.max_epochs
         assert next_model.num_on_load_checkpoint_called == 1
@@ -465,6 +469,7 @@ def test_trainer_max_steps_and_epochs(tmpdir):
     # define less train steps than epochs
     trainer_kwargs = {
         "limit_train_batches": 0.5,
+        "limit_val_batches": 0,
         "default_root_dir": tmpdir,
         "max_epochs": 3,
         "max_steps": num_train_samples + 10,
@@ -541,7 +546,6 @@ def test_trainer_max_steps_and_epochs_fit_loop_done(max_epochs, max_steps, is_do
 
 def test_trainer_min_steps_and_epochs(tmpdir):
     """Verify model trains according to specified min steps."""
-    num_train_samples = math.floor(len(BoringModel().train_dataloader()) * 0.5)
 
     class CustomModel(BoringModel):
         def training_step(self, *args, **kwargs):
@@ -552,6 +556,7 @@ def test_trainer_min_steps_and_epochs(tmpdir):
             return super().training_step(*args, **kwargs)
 
     model = CustomModel()
+    num_train_samples = math.floor(len(model.train_dataloader()) * 0.5)
 
     trainer_kwargs = {
         "limit_train_batches": 0.5,
@@ -656,22 +661,23 @@ def test_benchmark_option(tmpdir):
     assert torch.backends.cudnn.benchmark
 
 
+class EvaluationCheckpointModel(BoringModel):
+    def validation_step(self, batch, batch_idx):
+        self.log("foo", -batch_idx)
+        return super().validation_step(batch, batch_idx)
+
+    def test_step(self, *args):
+        return self.validation_step(*args)
+
+    def predict_step(self, batch, *_):
+        return self(batch)
+
+
 @pytest.mark.parametrize("ckpt_path", (None, "best", "specific"))
 @pytest.mark.parametrize("save_top_k", (-1, 0, 1, 2))
 @pytest.mark.parametrize("fn", ("validate", "test", "predict"))
 def test_checkpoint_path_input(tmpdir, ckpt_path, save_top_k, fn):
-    class TestModel(BoringModel):
-        def validation_step(self, batch, batch_idx):
-            self.log("foo", -batch_idx)
-            return super().validation_step(batch, batch_idx)
-
-        def test_step(self, *args):
-            return self.validation_step(*args)
-
-        def predict_step(self, batch, *_):
-            return self(batch)
-
-    model = TestModel()
+    model = EvaluationCheckpointModel()
     model.test_epoch_end = None
     trainer = Trainer(
         max_epochs=2,
@@ -683,6 +689,7 @@ def test_checkpoint_path_input(tmpdir, ckpt_path, save_top_k, fn):
         callbacks=[ModelCheckpoint(monitor="foo", save_top_k=save_top_k)],
     )
     trainer.fit(model)
+    best_model_path = trainer.checkpoint_callback.best_model_path
 
     trainer_fn = getattr(trainer, fn)
     assert getattr(trainer, "ckpt_path") is None
@@ -696,10 +703,10 @@ def test_checkpoint_path_input(tmpdir, ckpt_path, save_top_k, fn):
                 trainer_fn(model, ckpt_path=ckpt_path)
         else:
             trainer_fn(ckpt_path=ckpt_path)
-            assert getattr(trainer, "ckpt_path") == trainer.checkpoint_callback.best_model_path
+            assert getattr(trainer, "ckpt_path") == best_model_path
 
             trainer_fn(model, ckpt_path=ckpt_path)
-            assert getattr(trainer, "ckpt_path") == trainer.checkpoint_callback.best_model_path
+            assert getattr(trainer, "ckpt_path") == best_model_path
     elif ckpt_path is None:
         # ckpt_path is None, meaning we don't load any checkpoints and use the provided model
         trainer_fn(model, ckpt_path=ckpt_path)
@@ -709,18 +716,15 @@ def test_checkpoint_path_input(tmpdir, ckpt_path, save_top_k, fn):
             # ckpt_path is None with no model provided means load the best weights
             with pytest.warns(UserWarning, match="The best model of the previous `fit` call will be used"):
                 trainer_fn(ckpt_path=ckpt_path)
-                assert getattr(trainer, "ckpt_path") == trainer.checkpoint_callback.best_model_path
+                assert getattr(trainer, "ckpt_path") == best_model_path
     else:
         # specific checkpoint, pick one from saved ones
         if save_top_k == 0:
             with pytest.raises(FileNotFoundError):
                 trainer_fn(ckpt_path="random.ckpt")
         else:
-            ckpt_path = str(
-                list((Path(tmpdir) / f"lightning_logs/version_{trainer.logger.version}/checkpoints").iterdir())[
-                    0
-                ].absolute()
-            )
+            ckpt_dir = Path(tmpdir) / f"lightning_logs/version_{trainer.logger.version}/checkpoints"
+            ckpt_path = str(next(ckpt_dir.iterdir()).absolute())
             trainer_fn(ckpt_path=ckpt_path)
             assert getattr(trainer, "ckpt_path") == ckpt_path
 
@@ -731,18 +735,7 @@ def test_checkpoint_path_input(tmpdir, ckpt_path, save_top_k, fn):
 @pytest.mark.parametrize("enable_checkpointing", (False, True))
 @pytest.mark.parametrize("fn", ("validate", "test", "predict"))
 def test_tested_checkpoint_path_best(tmpdir, enable_checkpointing, fn):
-    class TestModel(BoringModel):
-        def validation_step(self, batch, batch_idx):
-            self.log("foo", -batch_idx)
-            return super().validation_step(batch, batch_idx)
-
-        def test_step(self, *args):
-            return self.validation_step(*args)
-
-        def predict_step(self, batch, *_):
-            return self(batch)
-
-    model = TestModel()
+    model = EvaluationCheckpointModel()
     model.test_epoch_end = None
     trainer = Trainer(
         max_epochs=2,
@@ -759,11 +752,12 @@ def test_tested_checkpoint_path_best(tmpdir, enable_checkpointing, fn):
     assert getattr(trainer, "ckpt_path") is None
 
     if enable_checkpointing:
+        best_model_path = trainer.checkpoint_callback.best_model_path
         trainer_fn(ckpt_path="best")
-        assert getattr(trainer, "ckpt_path") == trainer.checkpoint_callback.best_model_path
+        assert getattr(trainer, "ckpt_path") == best_model_path
 
         trainer_fn(model, ckpt_path="best")
-        assert getattr(trainer, "ckpt_path") == trainer.checkpoint_callback.best_model_path
+        assert getattr(trainer, "ckpt_path") == best_model_path
     else:
         with pytest.raises(MisconfigurationException, match="`ModelCheckpoint` is not configured."):
             trainer_fn(ckpt_path="best")
@@ -1314,6 +1308,8 @@ def test_trainer_omegaconf(_, trainer_params):
 
 
 def test_trainer_pickle(tmpdir):
+    import cloudpickle
+
     trainer = Trainer(max_epochs=1, default_root_dir=tmpdir)
     pickle.dumps(trainer)
     cloudpickle.dumps(trainer)